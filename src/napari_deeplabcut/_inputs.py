@@ -6,6 +6,13 @@ import qtpy.QtGui as Gui
 
 from napari_deeplabcut import misc
 
+import re
+
+__all__ = ["PyIntValidator", "AdjustableRangeSlider"]
+
+# precompiled to keep per-keystroke validation allocation-free
+_INT_RE = re.compile(r"[+-]?\d+\Z")
+
 
 def _is_int(string: str) -> bool:
     """
@@ -23,23 +30,27 @@ def _is_int(string: str) -> bool:
     bool
         True if string represents an int, False otherwise
     """
-    if string.startswith(('+', '-')):
-        return string[1:].isdigit()
-    return string.isdigit()
+    return _INT_RE.match(string) is not None
 
 
 class PyIntValidator(Gui.QValidator):
     """A validator that correctly validates all integers, regardless of size."""
 
-    def __init__(self, parent: Widgets.QWidget):
+    # bound once at class creation; validate() runs on every keystroke
+    _INVALID = Gui.QValidator.Invalid
+    _INTERMEDIATE = Gui.QValidator.Intermediate
+    _ACCEPTABLE = Gui.QValidator.Acceptable
+    _PREFIXES = frozenset(('', '+', '-'))
+
+    def __init__(self, parent: Widgets.QWidget) -> None:
         super().__init__(parent)
 
-    def validate(self, input_: str, pos: int) -> object:
-        state = Gui.QValidator.Invalid
-        if input_ in ('', '+', '-'):
-            state = Gui.QValidator.Intermediate
+    def validate(self, input_: str, pos: int) -> tuple[Gui.QValidator.State, str, int]:
+        state = self._INVALID
+        if input_ in self._PREFIXES:
+            state = self._INTERMEDIATE
         elif _is_int(input_):
-            state = Gui.QValidator.Acceptable
+            state = self._ACCEPTABLE
 
         return state, input_, pos
 
@@ -48,7 +59,7 @@ class AdjustableRangeSlider(Widgets.QWidget):
 
     rangeChanged = Signal()
 
-    def __init__(self, orientation: Qt.Orientation, parent: Widgets.QWidget):
+    def __init__(self, orientation: Qt.Orientation, parent: Widgets.QWidget) -> None:
         super().__init__(parent)
 
         # Attributes
@@ -83,10 +94,13 @@ class AdjustableRangeSlider(Widgets.QWidget):
         self._layout.addWidget(self.range_max_line_edit)
         self.setLayout(self._layout)
 
-    def _min_edited(self):
+    def _min_edited(self) -> None:
         """Ensures new maximum value fits within range bounds and is smaller than the current max."""
         new_min = int(self.range_min_line_edit.text())
 
+        if new_min == self._range.min:  # re-typing the same value is a no-op; don't cascade a signal
+            return
+
         # checks if new_min is invalid
         if new_min > self._range.max or not self._range_bounds.contains(new_min):
             self.range_min_line_edit.setText(str(self._range.min))  # reset to previous value
@@ -97,10 +111,13 @@ class AdjustableRangeSlider(Widgets.QWidget):
         self.slider.setRange(self._range.min, self._range.max)
         self.rangeChanged.emit()
 
-    def _max_edited(self):
+    def _max_edited(self) -> None:
         """Ensures new maximum value fits within range bounds and is larger than the current min."""
         new_max = int(self.range_max_line_edit.text())
 
+        if new_max == self._range.max:  # re-typing the same value is a no-op; don't cascade a signal
+            return
+
         # checks if new_max is invalid
         if new_max < self._range.min or not self._range_bounds.contains(new_max):
             self.range_max_line_edit.setText(str(self._range.max))
@@ -111,23 +128,29 @@ class AdjustableRangeSlider(Widgets.QWidget):
         self.slider.setRange(self._range.min, self._range.max)
         self.rangeChanged.emit()
 
-    def _update_widgets(self):
+    def _update_widgets(self) -> None:
         """Makes GUI elements congruent with programmatic values"""
 
-        self.range_min_line_edit.setText(str(self._range.min))
-        self.range_max_line_edit.setText(str(self._range.max))
-        self.slider.setRange(self._range.min, self._range.max)
+        # setText/setRange trigger signals and repaints even for no-op
+        # values, so only touch widgets that are actually out of date
+        min_text, max_text = str(self._range.min), str(self._range.max)
+        if self.range_min_line_edit.text() != min_text:
+            self.range_min_line_edit.setText(min_text)
+        if self.range_max_line_edit.text() != max_text:
+            self.range_max_line_edit.setText(max_text)
+        if (self.slider.minimum(), self.slider.maximum()) != (self._range.min, self._range.max):
+            self.slider.setRange(self._range.min, self._range.max)
 
     @property
-    def range(self):
+    def range(self) -> misc.InclusiveInterval:
         # returning a copy because user shouldn't be able to modify range outside provided method
         return self._range.copy()
 
     @property
-    def range_bounds(self):
+    def range_bounds(self) -> misc.InclusiveInterval:
         return self._range_bounds.copy()
 
-    def set_range(self, min_: int, max_: int | None = None, *, stretch_bounds: bool = False, emit: bool = True):
+    def set_range(self, min_: int, max_: int | None = None, *, stretch_bounds: bool = False, emit: bool = True) -> None:
         """
         Sets the range of the slider.
 
@@ -155,7 +178,7 @@ class AdjustableRangeSlider(Widgets.QWidget):
         if stretch_bounds:
             self._range = new_range # since we're stretching range_bounds, no special requirements for new_range
             self._range_bounds.normalize(self._range)  # change range_bounds to fit self._range
-        elif self._range_bounds.contains(new_range):  # check if new max_ and min_ fits
+        elif self._range_bounds.contains_range(new_range):  # check if new max_ and min_ fits
             self._range = new_range
         else:  # not stretching range_bounds and new range do not fit within the absolute range
             raise ValueError(f"When {stretch_bounds=}, new range [{min_}, {max_}] must fit within absolute range "
@@ -166,7 +189,7 @@ class AdjustableRangeSlider(Widgets.QWidget):
 
         self._update_widgets()
 
-    def set_range_bounds(self, min_: int, max_: int, *, emit: bool = True):
+    def set_range_bounds(self, min_: int, max_: int, *, emit: bool = True) -> None:
         """
         Sets the absolute range that self.range must fit within. self.range is automatically normalized to the new
         range_bounds to guarantee it fits within them.
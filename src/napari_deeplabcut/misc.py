@@ -1,59 +1,74 @@
 from __future__ import annotations
 
 import os
+import threading
 from enum import Enum, EnumMeta
-from itertools import cycle
+from functools import lru_cache
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from napari.utils import colormaps
 
-import cv2
 from qtpy import QtGui
 
 
 def unsorted_unique(array: Sequence) -> np.ndarray:
     """Return the unsorted unique elements of an array."""
-    _, inds = np.unique(array, return_index=True)
-    return np.asarray(array)[np.sort(inds)]
+    # Hash-based and first-occurrence-ordered, unlike np.unique which
+    # sorts and would need the indices gathered back
+    return pd.unique(np.asarray(array))
 
 
 def encode_categories(
-    categories: List[str], return_map: bool = False
+    categories: List[str],
+    return_map: bool = False,
+    map_: Optional[Dict] = None,
 ) -> Union[List[int], Tuple[List[int], Dict]]:
-    unique_cat = unsorted_unique(categories)
-    map_ = dict(zip(unique_cat, range(len(unique_cat))))
-    inds = np.vectorize(map_.get)(categories)
+    if map_ is not None:
+        # A caller-supplied mapping is applied in a single C loop
+        inds = pd.Series(categories).map(map_).to_numpy()
+        if return_map:
+            return inds, map_
+        return inds
+    # Categorical codes are computed through a C hash table in one pass;
+    # pinning the categories to first-seen order keeps the historical
+    # unsorted-unique numbering
+    cat = pd.Categorical(categories, categories=unsorted_unique(categories))
+    inds = cat.codes.astype(np.int64)
     if return_map:
-        return inds, map_
+        return inds, dict(zip(cat.categories, range(len(cat.categories))))
     return inds
 
 
+@lru_cache(maxsize=8)
+def _fancy_index_grid(n_frames: int, n_keypoints: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row/column index arrays for the scorer-merging gather below."""
+    return np.arange(n_frames)[:, None], np.arange(n_keypoints)
+
+
 def merge_multiple_scorers(
     df: pd.DataFrame,
 ) -> pd.DataFrame:
+    # Cheap single-scorer check (the common case) before building a header
+    if df.columns.get_level_values("scorer").nunique() == 1:
+        return df
+
     n_frames = df.shape[0]
     header = DLCHeader(df.columns)
     n_scorers = len(header._get_unique("scorer"))
-    if n_scorers == 1:
-        return df
 
     if "likelihood" in header.coords:
         # Merge annotations from multiple scorers to keep
         # detections with highest confidence
         data = df.to_numpy().reshape((n_frames, n_scorers, -1, 3))
-        try:
-            idx = np.nanargmax(data[..., 2], axis=1)
-        except ValueError:  # All-NaN slice encountered
-            mask = np.isnan(data[..., 2]).all(axis=1, keepdims=True)
-            mask = np.broadcast_to(mask[..., None], data.shape)
-            data[mask] = -1
-            idx = np.nanargmax(data[..., 2], axis=1)
-            data[mask] = np.nan
-        data_best = data[
-            np.arange(n_frames)[:, None], idx, np.arange(data.shape[2])
-        ].reshape((n_frames, -1))
+        lik = data[..., 2]
+        # NaN likelihoods are replaced by -inf prior to the argmax so that
+        # all-NaN slices pick an arbitrary scorer; their gathered
+        # coordinates remain NaN either way.
+        idx = np.where(np.isnan(lik), -np.inf, lik).argmax(axis=1)
+        rows, cols = _fancy_index_grid(n_frames, data.shape[2])
+        data_best = data[rows, idx, cols].reshape((n_frames, -1))
         df = pd.DataFrame(
             data_best,
             index=df.index,
@@ -77,12 +92,20 @@ def to_os_dir_sep(path: str) -> str:
     """
     win_sep, unix_sep = "\\", "/"
 
+    # scan for each separator once and reuse the results below
+    has_win = win_sep in path
+    has_unix = unix_sep in path
+
     # On UNIX systems, `win_sep` is a valid character in directory and file
     # names. This function fails if both are present.
-    if win_sep in path and unix_sep in path:
+    if has_win and has_unix:
         raise ValueError(f'"{path}" may not contain both "{win_sep}" and "{unix_sep}"!')
 
-    sep = win_sep if win_sep in path else unix_sep
+    sep = win_sep if has_win else unix_sep
+
+    # Nothing to substitute when the path already uses the native separator
+    if sep == os.path.sep:
+        return path
 
     return os.path.sep.join(path.split(sep))
 
@@ -93,37 +116,61 @@ def guarantee_multiindex_rows(df):
         path = df.index[0]
         try:
             sep = "/" if "/" in path else "\\"
-            splits = tuple(df.index.str.split(sep))
-            df.index = pd.MultiIndex.from_tuples(splits)
+            # expand=True splits columnwise in C and yields a MultiIndex
+            # directly, skipping the per-row list-of-tuples round-trip
+            new_index = df.index.str.split(sep, expand=True)
+            if not isinstance(new_index, pd.MultiIndex):
+                # single-component paths split into a flat Index, but
+                # callers rely on always getting a MultiIndex back
+                new_index = pd.MultiIndex.from_arrays([new_index])
+            df.index = new_index
         except TypeError:  # Ignore numerical index of frame indices
             pass
 
 
-def build_color_cycle(n_colors: int, colormap: Optional[str] = "viridis") -> np.ndarray:
+@lru_cache(maxsize=32)
+def _build_color_cycle_cached(n_colors: int, colormap: Optional[str]) -> np.ndarray:
     cmap = colormaps.ensure_colormap(colormap)
-    return cmap.map(np.linspace(0, 1, n_colors))
+    colors = cmap.map(np.linspace(0, 1, n_colors))
+    # The array is shared across calls; freeze it so a caller
+    # cannot mutate the cached copy.
+    colors.setflags(write=False)
+    return colors
+
+
+def build_color_cycle(n_colors: int, colormap: Optional[str] = "viridis") -> np.ndarray:
+    return _build_color_cycle_cached(n_colors, colormap)
 
 
 def frame2pixmap(frame: np.ndarray) -> QtGui.QPixmap:
     """
     Converts a frame (from cv2) into a QPixmap
 
+    No colorspace conversion is performed: Qt consumes the BGR bytes
+    directly, so neither cv2.cvtColor (and its thread pool) nor a NumPy
+    channel-reversal copy is involved.
+
     Parameters
     ----------
     frame : ndarray
-        The ndarray containing the image with shape (height, width, colors)
+        The ndarray containing the image with shape (height, width, colors),
+        in cv2's BGR channel order
 
     Returns
     -------
     QPixmap
         the pixel map conversion of the provided frame
     """
-    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    # Qt reads the BGR byte order directly, so no cv2.cvtColor copy is needed
+    frame = np.ascontiguousarray(frame)
 
     h, w, ch = frame.shape
     bytes_per_line = ch * w
 
-    image = QtGui.QImage(frame.data, w, h, bytes_per_line, QtGui.QImage.Format.Format_RGB888)
+    # The QImage wraps the ndarray's buffer without copying; fromImage
+    # copies the pixels before this function returns, so the caller's
+    # buffer may be reused (e.g. as a persistent decode target) afterwards
+    image = QtGui.QImage(frame.data, w, h, bytes_per_line, QtGui.QImage.Format.Format_BGR888)
 
     return QtGui.QPixmap.fromImage(image)
 
@@ -131,31 +178,56 @@ def frame2pixmap(frame: np.ndarray) -> QtGui.QPixmap:
 class DLCHeader:
     def __init__(self, columns: pd.MultiIndex):
         self.columns = columns
+        # Lazily filled by _get_unique; the columns only change through
+        # the scorer setter, which invalidates it
+        self._level_cache: Dict[str, List] = {}
 
     @classmethod
     def from_config(cls, config: Dict) -> DLCHeader:
         multi = config.get("multianimalproject", False)
         scorer = [config["scorer"]]
+        # The levels are already unique, so the MultiIndex is assembled
+        # from levels and codes directly; this skips the densification
+        # and re-factorization from_product/from_tuples would perform
         if multi:
-            columns = pd.MultiIndex.from_product(
-                [
-                    scorer,
-                    config["individuals"],
-                    config["multianimalbodyparts"],
-                    ["x", "y"],
-                ]
-            )
-            if len(config["uniquebodyparts"]):
-                temp = pd.MultiIndex.from_product(
-                    [scorer, ["single"], config["uniquebodyparts"], ["x", "y"]]
+            individuals = list(config["individuals"])
+            bodyparts = list(config["multianimalbodyparts"])
+            unique_bodyparts = list(config["uniquebodyparts"])
+            n_ind, n_bp = len(individuals), len(bodyparts)
+
+            ind_codes = np.repeat(np.arange(n_ind), 2 * n_bp)
+            bp_codes = np.tile(np.repeat(np.arange(n_bp), 2), n_ind)
+            if unique_bodyparts:
+                # unique bodyparts are attributed to a virtual 'single' individual
+                ind_codes = np.concatenate(
+                    [ind_codes, np.full(2 * len(unique_bodyparts), n_ind)]
+                )
+                bp_codes = np.concatenate(
+                    [bp_codes, np.repeat(np.arange(n_bp, n_bp + len(unique_bodyparts)), 2)]
                 )
-                columns = columns.append(temp)
-            columns.set_names(
-                ["scorer", "individuals", "bodyparts", "coords"], inplace=True
+                individuals += ["single"]
+                bodyparts += unique_bodyparts
+            n_columns = ind_codes.size
+            columns = pd.MultiIndex(
+                levels=[scorer, individuals, bodyparts, ["x", "y"]],
+                codes=[
+                    np.zeros(n_columns, dtype=np.intp),
+                    ind_codes,
+                    bp_codes,
+                    np.tile([0, 1], n_columns // 2),
+                ],
+                names=["scorer", "individuals", "bodyparts", "coords"],
             )
         else:
-            columns = pd.MultiIndex.from_product(
-                [scorer, config["bodyparts"], ["x", "y"]],
+            bodyparts = list(config["bodyparts"])
+            n_bp = len(bodyparts)
+            columns = pd.MultiIndex(
+                levels=[scorer, bodyparts, ["x", "y"]],
+                codes=[
+                    np.zeros(2 * n_bp, dtype=np.intp),
+                    np.repeat(np.arange(n_bp), 2),
+                    np.tile([0, 1], n_bp),
+                ],
                 names=["scorer", "bodyparts", "coords"],
             )
         return cls(columns)
@@ -168,7 +240,10 @@ class DLCHeader:
         ]
         temp = self.columns.droplevel(to_drop).unique()
         if "individuals" not in temp.names:
-            temp = pd.MultiIndex.from_product([self.individuals, temp])
+            # a plain cross product; no need to round-trip through a
+            # MultiIndex just to enumerate it back into tuples
+            bodyparts = temp.tolist()
+            return [(ind, bp) for ind in self.individuals for bp in bodyparts]
         return temp.to_list()
 
     @property
@@ -177,7 +252,13 @@ class DLCHeader:
 
     @scorer.setter
     def scorer(self, scorer: str):
+        current = self._get_unique("scorer")
+        if current and current[0] == scorer:
+            # rebuilding the MultiIndex allocates new levels and codes;
+            # skip it (and the cache invalidation) for no-op assignments
+            return
         self.columns = self.columns.set_levels([scorer], level="scorer")
+        self._level_cache.clear()
 
     @property
     def individuals(self) -> List[str]:
@@ -195,22 +276,44 @@ class DLCHeader:
         return self._get_unique("coords")
 
     def _get_unique(self, name: str) -> Optional[List]:
-        if name in self.columns.names:
-            return list(unsorted_unique(self.columns.get_level_values(name)))
-        return None
+        if name not in self.columns.names:
+            return None
+        cached = self._level_cache.get(name)
+        if cached is None:
+            # Work on the compact integer codes rather than materializing
+            # the full level values for every column
+            level_ind = self.columns.names.index(name)
+            level = self.columns.levels[level_ind]
+            codes = np.asarray(self.columns.codes[level_ind])
+            first = np.unique(codes, return_index=True)[1]
+            cached = [level[codes[ind]] for ind in np.sort(first)]
+            self._level_cache[name] = cached
+        return cached
 
 
 class CycleEnumMeta(EnumMeta):
-    def __new__(metacls, cls, bases, classdict):
-        enum_ = super().__new__(metacls, cls, bases, classdict)
-        enum_._cycle = cycle(enum_._member_map_[name] for name in enum_._member_names_)
+    def __new__(metacls, cls, bases, classdict, **kwds):
+        enum_ = super().__new__(metacls, cls, bases, classdict, **kwds)
+        enum_._members_tuple = tuple(
+            enum_._member_map_[name] for name in enum_._member_names_
+        )
+        enum_._cursor = 0
+        enum_._cursor_lock = threading.Lock()
         return enum_
 
-    def __iter__(cls):
-        return cls._cycle
+    # __iter__ is deliberately left to EnumMeta so `list(cls)` and
+    # `for member in cls` remain bounded; cycling goes through next()
 
     def __next__(cls):
-        return next(cls.__iter__())
+        return cls.next()
+
+    def next(cls):
+        """Returns the next member in cyclic order. Threadsafe."""
+        members = cls._members_tuple
+        with cls._cursor_lock:
+            i = cls._cursor
+            cls._cursor = (i + 1) % len(members)
+        return members[i]
 
     def __getitem__(self, item):
         if isinstance(item, str):
@@ -233,6 +336,8 @@ class InclusiveInterval:
     Forces the min to be less than max
     """
 
+    __slots__ = ("_min", "_max")
+
     def __init__(self, min_: int | float, max_: int | float):
         self._min = self._max = 0
         self.set(min_, max_)
@@ -246,8 +351,10 @@ class InclusiveInterval:
         ValueError
             if int(min_) < int(max_)
         """
-        min_ = int(min_)
-        max_ = int(max_)
+        if type(min_) is not int:
+            min_ = int(min_)
+        if type(max_) is not int:
+            max_ = int(max_)
 
         if min_ > max_:
             raise ValueError("min_ cannot be greater than max_")
@@ -261,7 +368,8 @@ class InclusiveInterval:
 
     @min.setter
     def min(self, new_min: int | float) -> None:
-        new_min = int(new_min)
+        if type(new_min) is not int:
+            new_min = int(new_min)
 
         if new_min > self._max:
             raise ValueError("min cannot be larger than max")
@@ -274,16 +382,22 @@ class InclusiveInterval:
 
     @max.setter
     def max(self, new_max: int | float) -> None:
-        new_max = int(new_max)
+        if type(new_max) is not int:
+            new_max = int(new_max)
 
         if new_max < self._min:
             raise ValueError("max cannot be less than min")
 
-        self._max = int(new_max)
+        self._max = new_max
 
     def copy(self) -> InclusiveInterval:
         """Creates a copy of this InclusiveInterval"""
-        return self.__class__(self._min, self._max)
+        # _min/_max are already validated ints, so skip __init__'s
+        # casting and bound checks
+        new = self.__class__.__new__(self.__class__)
+        new._min = self._min
+        new._max = self._max
+        return new
 
     __copy__ = __deepcopy__ = copy
 
@@ -333,9 +447,18 @@ class InclusiveInterval:
             True if num fits within the interval [self.min, self.max]
         """
         if isinstance(num, InclusiveInterval):
-            return self.min <= num.min and num.max <= self.max
+            return self.contains_range(num)
 
-        return self.min <= num <= self.max
+        return self._min <= num <= self._max
+
+    def contains_range(self, other: InclusiveInterval) -> bool:
+        """
+        Checks if another InclusiveInterval fits entirely within this one.
+
+        Callers that know they hold an interval can use this directly and skip
+        contains' isinstance dispatch.
+        """
+        return self._min <= other._min and other._max <= self._max
 
     def __eq__(self, other) -> bool:
         if isinstance(other, self.__class__):
@@ -346,6 +469,15 @@ class InclusiveInterval:
     def __str__(self) -> str:
         return f"[{self.min}, {self.max}]"
 
+    def __iter__(self):
+        # Lets `min_, max_ = interval` and `f(*interval)` unpack directly
+        # instead of probing __getitem__ until IndexError
+        yield self._min
+        yield self._max
+
+    def __len__(self) -> int:
+        return 2
+
     def __getitem__(self, item: int | slice):
         if item == 0:
             return self._min
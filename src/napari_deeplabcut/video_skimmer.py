@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QRunnable, QThreadPool
 from qtpy.QtWidgets import QGraphicsView, QGraphicsScene, QWidget, QSpinBox, QVBoxLayout, QHBoxLayout
 from qtpy.QtGui import QWheelEvent, QPixmap
 from napari_deeplabcut import _inputs as inputs
 
+import collections
 import cv2
 import os.path
+import subprocess
 from napari_deeplabcut import misc
 
 
@@ -18,6 +20,10 @@ class ZoomView(QGraphicsView):
         self.setScene(self._scene)
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
 
+        # one reusable item; clearing and re-adding on every frame would
+        # invalidate the whole scene each slider tick
+        self._pix_item = self._scene.addPixmap(QPixmap())
+
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Converted to Python from https://stackoverflow.com/a/41688654"""
         if event.modifiers() == Qt.ControlModifier:  # ctrl+scroll zooms
@@ -31,8 +37,29 @@ class ZoomView(QGraphicsView):
             super().wheelEvent(event)
 
     def set_pixmap(self, pm: QPixmap) -> None:
-        self._scene.clear()
-        self._scene.addPixmap(pm)
+        self._pix_item.setPixmap(pm)
+
+
+class _FramePrefetcher(QRunnable):
+    """Decodes one frame ahead of the current one while the GUI is idle.
+
+    The decoded ndarray is stashed on the skimmer; pixmap conversion stays on
+    the GUI thread since QPixmaps must not be created from worker threads.
+    """
+
+    def __init__(self, skimmer: VideoSkimmer, video: cv2.VideoCapture, video_path: str, frame_num: int):
+        super().__init__()
+        self._skimmer = skimmer
+        self._video = video
+        self._video_path = video_path
+        self._frame_num = frame_num
+
+    def run(self) -> None:
+        self._video.set(cv2.CAP_PROP_POS_FRAMES, self._frame_num)
+        ret, frame = self._video.read()
+        # drop the result if set_video swapped videos while we were decoding
+        if ret and self._video is self._skimmer._prefetch_video:
+            self._skimmer._prefetch = (self._video_path, self._frame_num, frame)
 
 
 class VideoSkimmer(QWidget):
@@ -51,6 +78,33 @@ class VideoSkimmer(QWidget):
         self._current_frame: int = -1
         self._total_frames: int = 0
 
+        # guards the slider <-> spinbox synchronization so one user action
+        # runs a single handler body (and thus a single frame decode)
+        self._syncing: bool = False
+
+        # recently rendered pixmaps, keyed by (video_path, frame_num,
+        # viewport_width, viewport_height); scrubbing revisits nearby frames
+        # often, and a hit skips both the cv2 seek/decode and the pixmap
+        # conversion
+        self._pixmap_cache: collections.OrderedDict[tuple[str, int, int, int], QPixmap] = collections.OrderedDict()
+        self._pixmap_cache_size: int = 16
+
+        # persistent decode target so cv2 reuses one frame buffer
+        # instead of allocating a fresh ndarray per preview
+        self._frame_buf = None
+
+        # index of the frame the capture last decoded; read() already
+        # advances by one, so stepping forward needs no explicit seek
+        self._last_decoded: int = -2
+
+        # one-frame-ahead decode: a worker fills self._prefetch with
+        # (video_path, frame_num, frame) from a second capture so forward
+        # steps can skip the synchronous decode inside the slider callback
+        self._prefetch: tuple[str, int, object] | None = None
+        self._prefetch_video: cv2.VideoCapture | None = None
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+
         self._frame_preview: ZoomView = ZoomView(self)
         self._frame_preview.setMinimumSize(256, 144)
 
@@ -86,23 +140,88 @@ class VideoSkimmer(QWidget):
 
     def _on_frame_slider_change(self):
         """Ensures frame_slider and frame_spinbox hold the same value."""
-        new_val = self._frame_slider.slider.value()
+        if self._syncing:
+            return
+        self._syncing = True
+        try:
+            new_val = self._frame_slider.slider.value()
 
-        self._frame_spinbox.setValue(new_val)
-        self.set_frame(new_val)
+            self._frame_spinbox.setValue(new_val)
+            self.set_frame(new_val)
+        finally:
+            self._syncing = False
 
     def _on_frame_spinbox_change(self):
         """Ensures frame_slider and frame_spinbox hold the same value."""
-        new_val = self._frame_spinbox.value()
+        if self._syncing:
+            return
+        self._syncing = True
+        try:
+            new_val = self._frame_spinbox.value()
 
-        self._frame_slider.slider.setValue(new_val)
-        self.set_frame(new_val)
+            self._frame_slider.slider.setValue(new_val)
+            self.set_frame(new_val)
+        finally:
+            self._syncing = False
 
     def update_preview(self):
         """Sets the Pixmap of the frame_preview label to the currently selected frame."""
-        self._video.set(cv2.CAP_PROP_POS_FRAMES, self._current_frame)
-        ret, frame = self._video.read()
-        self._frame_preview.set_pixmap(misc.frame2pixmap(frame))
+        # the viewport size is part of the key: cached pixmaps are rendered
+        # at the preview's size, so entries from before a resize must miss
+        view = self._frame_preview.viewport().size()
+        key = (self._video_path, self._current_frame, view.width(), view.height())
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            prefetched = self._prefetch
+            if (
+                prefetched is not None
+                and prefetched[0] == self._video_path
+                and prefetched[1] == self._current_frame
+            ):
+                frame = prefetched[2]
+            else:
+                # seeking can force a keyframe re-decode on some codecs, so
+                # only seek when the capture is not already positioned here
+                if self._current_frame != self._last_decoded + 1:
+                    self._video.set(cv2.CAP_PROP_POS_FRAMES, self._current_frame)
+                if self._frame_buf is None:
+                    ret, self._frame_buf = self._video.read()
+                else:
+                    ret, self._frame_buf = self._video.read(self._frame_buf)
+                self._last_decoded = self._current_frame
+                frame = self._frame_buf
+
+            # shrink high-resolution sources to the preview's size before the
+            # pixmap conversion; all downstream costs scale with pixel count
+            h, w = frame.shape[:2]
+            scale = min(view.width() / w, view.height() / h)
+            if 0 < scale < 1:
+                frame = cv2.resize(
+                    frame,
+                    (max(1, round(w * scale)), max(1, round(h * scale))),
+                    interpolation=cv2.INTER_AREA,
+                )
+
+            pixmap = misc.frame2pixmap(frame)
+            self._pixmap_cache[key] = pixmap
+            if len(self._pixmap_cache) > self._pixmap_cache_size:
+                self._pixmap_cache.popitem(last=False)
+        else:
+            self._pixmap_cache.move_to_end(key)
+        self._frame_preview.set_pixmap(pixmap)
+
+        # queue a decode of the likely next frame during GUI idle time
+        next_frame = self._current_frame + 1
+        if (
+            self._prefetch_video is not None
+            and self.in_frame_range(next_frame)
+            and (self._video_path, next_frame, view.width(), view.height())
+            not in self._pixmap_cache
+        ):
+            self._prefetch = None
+            self._prefetch_pool.start(
+                _FramePrefetcher(self, self._prefetch_video, self._video_path, next_frame)
+            )
 
     @classmethod
     def is_supported_file(cls, path: str) -> bool:
@@ -168,23 +287,70 @@ class VideoSkimmer(QWidget):
                              f"Current supported types are: {self.supported_video_ext}")
 
         self._video_path = video_path
-        self._video = cv2.VideoCapture(video_path)
+        try:
+            # ask FFmpeg for any available hardware decoder; on supported
+            # systems this moves the per-frame decode off the CPU
+            self._video = cv2.VideoCapture(
+                video_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+            if not self._video.isOpened():
+                raise cv2.error("could not open video with the FFMPEG backend")
+        except (AttributeError, TypeError, cv2.error):
+            # builds without the params constructor or the FFMPEG backend
+            self._video = cv2.VideoCapture(video_path)
+        self._frame_buf = None  # frame shape may differ between videos
+        self._last_decoded = -2
+
+        # separate capture for the prefetch worker so it never races the
+        # GUI thread's seeks on self._video
+        self._prefetch = None
+        self._prefetch_video = cv2.VideoCapture(video_path)
 
         self._total_frames = int(self._video.get(cv2.CAP_PROP_FRAME_COUNT))
 
         # if total frames == 0 here, then the selected video probably doesn't support cv2.CAP_PROP_FRAME_COUNT
-        # thus, we must manually count the number of frames (which is really slow)
+        # thus, we must count the number of frames another way
         if self._total_frames == 0:
-            ret, = self._video.read()
-            while ret:
-                self._total_frames += 1
-                ret, = self._video.read()
+            self._total_frames = self._count_frames()
 
         # set ranges and range to [0, index of last frame]
         self._frame_slider.set_range_bounds(0, self.get_largest_frame())
         self.set_frame_range()
         self.set_frame(0)
 
+    def _count_frames(self) -> int:
+        """
+        Counts the frames of a video whose container does not report cv2.CAP_PROP_FRAME_COUNT.
+
+        Tries progressively slower strategies: a demuxer-level packet count via ffprobe, then a
+        decode-free seek to the end of the stream, and only as a last resort stepping through the
+        whole video (with grab(), which skips frame decoding and ndarray allocation).
+        """
+        try:
+            out = subprocess.run(
+                ['ffprobe', '-v', 'error', '-select_streams', 'v:0', '-count_packets',
+                 '-show_entries', 'stream=nb_read_packets', '-of', 'csv=p=0', self._video_path],
+                capture_output=True, text=True,
+            )
+            count = int(out.stdout.strip())
+            if count > 0:
+                return count
+        except (OSError, ValueError):
+            pass
+
+        if self._video.set(cv2.CAP_PROP_POS_AVI_RATIO, 1.0):
+            count = int(self._video.get(cv2.CAP_PROP_POS_FRAMES))
+            self._video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            if count > 0:
+                return count
+
+        count = 0
+        while self._video.grab():
+            count += 1
+        return count
+
     def in_frame_range(self, frame_num: int) -> bool:
         """Checks if frame_num fits within the current frame_range"""
         return self._frame_slider.range.contains(frame_num)